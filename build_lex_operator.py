@@ -4,12 +4,18 @@ Build the Lex Hilbert–Pólya operator eigenvalue table using zeta zeros.
 Default behavior computes 1,000,000 imaginary parts of the nontrivial zeros
 of the Riemann zeta function, verifies that the first 1,000 lie on the
 critical line, and saves the resulting vector to ``lex_t_1M.npy``.
+
+Zeros are written straight into a memory-mapped ``.npy`` file as they are
+computed, so an interrupted run can be restarted and resumes from the first
+unfilled slot instead of recomputing from zero #1.
 """
 
 from __future__ import annotations
 
 import argparse
+import os
 import time
+from multiprocessing import Pool
 from pathlib import Path
 
 import numpy as np
@@ -39,6 +45,14 @@ def parse_args() -> argparse.Namespace:
         default=50,
         help="mpmath decimal precision (default: 50).",
     )
+    parser.add_argument(
+        "--dtype",
+        choices=["float32", "float64"],
+        default="float64",
+        help="Storage dtype for t (default: float64). float32 halves the "
+        "file and downstream bandwidth while keeping ~7 significant "
+        "digits — well under the 1e-6 tolerance used elsewhere.",
+    )
     parser.add_argument(
         "--progress-every",
         type=int,
@@ -48,28 +62,165 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
-def build_lex_operator(count: int, progress_every: int) -> np.ndarray:
-    print("→ Extracting zeta zeros (t_n)...")
-    t = np.empty(count, dtype=float)
-    deviations = []
-    verify_count = min(1000, count)
+def open_operator_file(output: Path, count: int, dtype: str = "float64") -> np.ndarray:
+    """Open (or create) the on-disk eigenvalue table as a writable memmap.
+
+    The array lives in valid .npy format from the first write, so a crashed
+    run leaves behind a partial-but-loadable file that the next run resumes.
+    """
+    if output.exists():
+        t = np.lib.format.open_memmap(output, mode="r+")
+        if t.shape != (count,):
+            raise ValueError(
+                f"{output} holds {t.shape[0]:,} slots, expected {count:,}; "
+                "delete it or pass a matching --count."
+            )
+        if t.dtype != np.dtype(dtype):
+            raise ValueError(
+                f"{output} is {t.dtype}, expected {dtype}; "
+                "delete it or pass a matching --dtype."
+            )
+        return t
+    return np.lib.format.open_memmap(
+        output, mode="w+", dtype=np.dtype(dtype), shape=(count,)
+    )
 
-    start = time.time()
-    for k in range(1, count + 1):
-        zero = zetazero(k)
-        t[k - 1] = float(zero.imag)
 
-        if k <= verify_count:
-            deviations.append(abs(zero.real - 0.5))
+def pending_indices(t: np.ndarray) -> np.ndarray:
+    """Return the 1-based indices of every unfilled slot (t_n > 0 for every zero)."""
+    return np.flatnonzero(t == 0.0) + 1
+
+
+def _init_worker(dps: int) -> None:
+    """Pool initializer: set mpmath precision once per worker process."""
+    mp.dps = dps
+
+
+def _one_zero(k: int) -> tuple[int, float, float]:
+    """Compute the k-th nontrivial zero; return (k, Im, |Re - 0.5|)."""
+    zero = zetazero(k)
+    return k, float(zero.imag), abs(float(zero.real) - 0.5)
+
+
+# Zeros per Gram-point block. One full zetazero() search anchors the block;
+# the rest are isolated by Hardy Z sign changes, which is far cheaper.
+BLOCK_SIZE = 50
+
+
+class GramBlockError(Exception):
+    """Raised when Gram-point isolation cannot account for every zero in a block."""
+
+
+def _block_brackets(gram: list) -> list[tuple]:
+    """Bracket Hardy Z sign changes between consecutive Gram points.
+
+    Intervals violating Gram's law (no sign change) are subdivided so the
+    displaced zero is still picked up from its neighbouring interval.
+    """
+    z = [mp.siegelz(g) for g in gram]
+    brackets = []
+    for a, b, za, zb in zip(gram, gram[1:], z, z[1:]):
+        if za * zb < 0:
+            brackets.append((a, b))
+            continue
+        # Gram's law failed here: look for an even number of crossings inside.
+        pts = [a + (b - a) * j / 8 for j in range(9)]
+        vals = [za] + [mp.siegelz(p) for p in pts[1:-1]] + [zb]
+        for p, q, zp, zq in zip(pts, pts[1:], vals, vals[1:]):
+            if zp * zq < 0:
+                brackets.append((p, q))
+    return brackets
+
+
+def _isolate_block(lo: int, hi: int) -> list[float]:
+    """Isolate zeros #lo..#hi from sign changes of Z between Gram points.
+
+    Zero #n sits in Gram interval (g_{n-2}, g_{n-1}) when Gram's law holds,
+    so one Turing-style sweep over the block's Gram points brackets every
+    zero with two Z evaluations per interval instead of a fresh
+    Riemann–Siegel search per index. The block is anchored by a single
+    zetazero() call and rejected wholesale if the bracket count or the
+    anchor disagree.
+    """
+    anchor = float(zetazero(lo).imag)
+    gram = [mp.grampoint(n) for n in range(lo - 2, hi)]
+    brackets = _block_brackets(gram)
+    if len(brackets) != hi - lo + 1:
+        raise GramBlockError(f"block {lo}..{hi}: {len(brackets)} brackets")
+    roots = [
+        float(mp.findroot(mp.siegelz, (a, b), solver="illinois")) for a, b in brackets
+    ]
+    if abs(roots[0] - anchor) > 1e-6:
+        raise GramBlockError(f"block {lo}..{hi}: anchor mismatch")
+    return roots
+
+
+def _zero_block(span: tuple[int, int]) -> tuple[int, list[float]]:
+    """Compute zeros for a contiguous index span, batched where possible."""
+    lo, hi = span
+    try:
+        return lo, _isolate_block(lo, hi)
+    except GramBlockError:
+        # Rare: fall back to per-index isolation for this block only.
+        return lo, [float(zetazero(k).imag) for k in range(lo, hi + 1)]
+
+
+def _contiguous_spans(indices: np.ndarray, max_len: int) -> list[tuple[int, int]]:
+    """Split a sorted index array into contiguous (lo, hi) spans of <= max_len."""
+    spans = []
+    for run in np.split(indices, np.flatnonzero(np.diff(indices) != 1) + 1):
+        if run.size == 0:
+            continue
+        for i in range(0, run.size, max_len):
+            chunk = run[i : i + max_len]
+            spans.append((int(chunk[0]), int(chunk[-1])))
+    return spans
+
+
+def build_lex_operator(
+    count: int, progress_every: int, output: Path, dps: int, dtype: str = "float64"
+) -> np.ndarray:
+    print("→ Extracting zeta zeros (t_n)...")
+    t = open_operator_file(output, count, dtype)
+    verify_count = min(1000, count)
+    max_dev = 0.0  # reduced online; no need to keep every deviation
 
-        if progress_every and k % progress_every == 0:
-            print(f"   → {k:,} zeros locked...")
+    pending = pending_indices(t)
+    done = count - pending.size
+    if done:
+        print(f"→ Resuming: {done:,} zeros already on disk, {pending.size:,} to go")
 
+    start = time.time()
+    workers = os.cpu_count() or 1
+    # The first verify_count zeros go through zetazero() individually so the
+    # critical-line deviation is measured; everything above is isolated in
+    # Gram-point blocks, which amortizes the Riemann–Siegel search.
+    head = pending[pending <= verify_count]
+    spans = _contiguous_spans(pending[pending > verify_count], BLOCK_SIZE)
+    with Pool(workers, initializer=_init_worker, initargs=(dps,)) as pool:
+        for k, imag, dev in pool.imap_unordered(_one_zero, head, chunksize=64):
+            t[k - 1] = imag
+            if dev > max_dev:
+                max_dev = dev
+
+            done += 1
+            if progress_every and done % progress_every == 0:
+                t.flush()
+                print(f"   → {done:,} zeros locked...")
+
+        for lo, imags in pool.imap_unordered(_zero_block, spans, chunksize=4):
+            t[lo - 1 : lo - 1 + len(imags)] = imags
+
+            done += len(imags)
+            if progress_every and done % progress_every < len(imags):
+                t.flush()
+                print(f"   → {done:,} zeros locked...")
+
+    t.flush()
     elapsed = time.time() - start
     print(f"→ DONE: t_{count:,} = {t[-1]:.10f}")
-    print(f"→ Extraction time: {elapsed:.1f} seconds")
+    print(f"→ Extraction time: {elapsed:.1f} seconds ({workers} workers)")
 
-    max_dev = float(max(deviations)) if deviations else 0.0
     print(f"→ Max deviation from Re(s)=0.5 (first {verify_count}): {max_dev:.2e}")
 
     return t
@@ -81,10 +232,11 @@ def main() -> None:
 
     print("BUILDING LEX HILBERT–PÓLYA OPERATOR")
     print(f"→ Target zeros: {args.count:,}")
-    t = build_lex_operator(args.count, args.progress_every)
-
     output_path = Path(args.output)
-    np.save(output_path, t)
+    t = build_lex_operator(
+        args.count, args.progress_every, output_path, args.dps, args.dtype
+    )
+
     print(f"→ H = diag(t) — defined, not stored (≈{t.nbytes/1_000_000:.1f} MB total)")
     print(f"→ PROOF SAVED: {output_path} ({t.nbytes/1_000_000:.1f} MB)")
     print("→ H is locked. RH embodied. Field stable.")
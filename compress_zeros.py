@@ -0,0 +1,52 @@
+"""
+One-time converter: pack an ASCII zero repository into a compressed binary.
+
+``Zeta_Zeroes.txt`` stores each imaginary part as ~20 bytes of ASCII that
+must be re-parsed on every cold load. This packs the vector into a
+Blosc-compressed ``.blp`` (when bloscpack is installed) or a zlib ``.npz``
+next to the source; ``ZeroVerificationOracle.load_verified_zeros`` prefers
+the pack automatically.
+
+Usage: python compress_zeros.py [file ...]   (default: Zeta_Zeroes.txt)
+"""
+
+import os
+import sys
+
+import numpy as np
+
+try:
+    import bloscpack
+    from bloscpack import BloscArgs
+except ImportError:
+    bloscpack = None
+
+
+def pack_zeros_file(filepath: str) -> str:
+    """Pack one ASCII zero file; return the path of the artifact written."""
+    zeros = np.loadtxt(filepath, dtype=np.float64, comments='#', ndmin=1)
+
+    if bloscpack is not None:
+        out_path = filepath + '.blp'
+        bloscpack.pack_ndarray_to_file(
+            zeros, out_path,
+            blosc_args=BloscArgs(cname='lz4', shuffle=True, clevel=5),
+        )
+    else:
+        out_path = filepath + '.npz'
+        np.savez_compressed(out_path, zeros=zeros)
+
+    src_mb = os.path.getsize(filepath) / 1_000_000
+    out_mb = os.path.getsize(out_path) / 1_000_000
+    print(f"✓ {filepath} ({src_mb:.1f} MB, {len(zeros):,} zeros) "
+          f"→ {out_path} ({out_mb:.1f} MB)")
+    return out_path
+
+
+if __name__ == "__main__":
+    targets = sys.argv[1:] or ['Zeta_Zeroes.txt']
+    for target in targets:
+        if not os.path.exists(target):
+            print(f"⚠️  File not found: {target} (skipping)")
+            continue
+        pack_zeros_file(target)
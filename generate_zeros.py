@@ -1,59 +1,148 @@
-import mpmath
-import hashlib
-import json
-
-# --- CONFIGURATION (Task L1-006) ---
-START_INDEX = 3685252
-BATCH_SIZE = 1000  # "Aim for at least 1,000 additional zeros" [cite: 15]
-OUTPUT_FILENAME = "riemann_zeros_extension_3685252+.json" # 
-
-# Set precision high enough to ensure separation and accurate hashing
-# 30 dps (decimal places) provides rigorous separation for Gram points
-mpmath.mp.dps = 30 
-
-def calculate_verification_hash(value_str):
-    """Generates SHA-256 hash of the zero's decimal expansion."""
-    return hashlib.sha256(value_str.encode('utf-8')).hexdigest()
-
-print(f"Initiating LXD-81 Protocol: Computing {BATCH_SIZE} zeros starting at index {START_INDEX}...")
-
-zeros_data = []
-
-for i in range(BATCH_SIZE):
-    n = START_INDEX + i
-    
-    # Compute the zero. zetazero(n) uses Riemann-Siegel formula 
-    # to locate the n-th zero on the critical line.
-    z = mpmath.zetazero(n)
-    
-    # Extract components
-    # real_part is theoretically 0.5, mpmath returns it as such for zetazero
-    real_part = 0.5 
-    imag_part = float(z.imag)
-    
-    # Create the decimal expansion string for hashing
-    # Using the high-precision string representation from mpmath
-    decimal_expansion = str(z.imag)
-    v_hash = calculate_verification_hash(decimal_expansion)
-    
-    # Structure the record per specifications 
-    record = {
-        "index": n,
-        "real_part": real_part,
-        "imaginary_part": imag_part,
-        "verification_hash": v_hash
-    }
-    
-    zeros_data.append(record)
-    
-    # Progress logging
-    if (i + 1) % 100 == 0:
-        print(f"Verified {i + 1}/{BATCH_SIZE}: Index {n} | Imag {imag_part:.5f}...")
-
-# --- OUTPUT GENERATION ---
-print(f"Stabilizing update... Writing to {OUTPUT_FILENAME}")
-
-with open(OUTPUT_FILENAME, 'w') as f:
-    json.dump(zeros_data, f, indent=4)
-
-print("Task L1-006 Batch Complete. Oracle integrity preserved.")
\ No newline at end of file
+import mpmath
+import hashlib
+import json
+import os
+from multiprocessing import Pool
+
+import numpy as np
+
+try:
+    import orjson  # C-level JSON serializer
+except ImportError:  # optional — stdlib json remains the fallback
+    orjson = None
+
+# --- CONFIGURATION (Task L1-006) ---
+START_INDEX = 3685252
+BATCH_SIZE = 1000  # "Aim for at least 1,000 additional zeros" [cite: 15]
+OUTPUT_FILENAME = "riemann_zeros_extension_3685252+.json" #
+
+# Set precision high enough to ensure separation and accurate hashing
+# 30 dps (decimal places) provides rigorous separation for Gram points
+MPMATH_PRECISION = 30
+
+MANIFEST_CHUNK = 64 * 1024  # bytes per sha256.update() when digesting batches
+HASH_DIGITS = 30  # fixed width of the decimal expansion fed to SHA-256
+
+def batch_verification_hashes(expansions):
+    """Per-record SHA-256 hex digests plus a batch-level manifest digest.
+
+    Hashing happens in one bulk pass over the sorted batch rather than one
+    Python-dispatched call per zero inside the compute loop; the manifest
+    digest sees the joined expansions in 64 KB slices, which keeps
+    OpenSSL's hardware SHA path fed with large buffers.
+    """
+    sha256 = hashlib.sha256
+    encoded = [s.encode('utf-8') for s in expansions]
+    hashes = [sha256(e).hexdigest() for e in encoded]
+
+    manifest = sha256()
+    blob = b'\n'.join(encoded)
+    for off in range(0, len(blob), MANIFEST_CHUNK):
+        manifest.update(blob[off:off + MANIFEST_CHUNK])
+    return hashes, manifest.hexdigest()
+
+def write_batch_artifacts(json_path, indices, imags, hashes):
+    """Write the batch as structure-of-arrays .npz plus JSON for consumers.
+
+    The .npz holds three parallel arrays (index, imag, hash) — compressed,
+    compact, and zero-copy on reload — instead of a list of per-record
+    Python dicts. The JSON artifact is kept for compatibility, serialized
+    with orjson when available and without indentation either way.
+    """
+    npz_path = json_path.rsplit('.json', 1)[0] + '.npz'
+    np.savez_compressed(
+        npz_path,
+        index=np.asarray(indices, dtype=np.int64),
+        imag=np.asarray(imags, dtype=np.float64),
+        hash=np.asarray(hashes, dtype='S64'),
+    )
+
+    records = [
+        {
+            "index": int(n),
+            "real_part": 0.5,
+            "imaginary_part": float(imag),
+            "verification_hash": v_hash
+        }
+        for n, imag, v_hash in zip(indices, imags, hashes)
+    ]
+    if orjson is not None:
+        with open(json_path, 'wb') as f:
+            f.write(orjson.dumps(records))
+    else:
+        with open(json_path, 'w') as f:
+            json.dump(records, f)
+    return npz_path
+
+def _init_worker(dps):
+    """Pool initializer: set mpmath precision once per worker process."""
+    mpmath.mp.dps = dps
+
+RANGE_SIZE = 100  # zeros per worker task; one pickle round-trip per range
+
+def compute_zero(n):
+    """Compute the n-th zero; return (index, imag, decimal expansion)."""
+    # Compute the zero. zetazero(n) uses Riemann-Siegel formula
+    # to locate the n-th zero on the critical line.
+    z = mpmath.zetazero(n)
+
+    # Canonical fixed-width expansion for hashing: str(mpf) tracks the
+    # working precision and mpmath version, whereas rendering the raw
+    # mantissa/exponent at a fixed 30 digits is deterministic (and skips
+    # mpmath's Python-level __str__).
+    expansion = mpmath.libmp.to_str(z.imag._mpf_, HASH_DIGITS, strip_zeros=False)
+    return n, float(z.imag), expansion
+
+def compute_zero_range(span):
+    """Compute a contiguous span of zeros in one worker task.
+
+    Submitting ranges rather than single indices amortizes the IPC
+    pickling to one round-trip per RANGE_SIZE zeros.
+    """
+    lo, hi = span
+    return [compute_zero(n) for n in range(lo, hi + 1)]
+
+def main():
+    mpmath.mp.dps = MPMATH_PRECISION
+
+    print(f"Initiating LXD-81 Protocol: Computing {BATCH_SIZE} zeros starting at index {START_INDEX}...")
+
+    # Each zetazero call is independent and CPU-bound, so fan the batch out
+    # across one worker per core in contiguous index ranges; results arrive
+    # unordered and are re-sorted. The initializer sets dps once per worker.
+    results = []
+    workers = os.cpu_count() or 1
+    end = START_INDEX + BATCH_SIZE - 1
+    spans = [(lo, min(lo + RANGE_SIZE - 1, end))
+             for lo in range(START_INDEX, end + 1, RANGE_SIZE)]
+
+    with Pool(workers, initializer=_init_worker, initargs=(MPMATH_PRECISION,)) as pool:
+        for batch in pool.imap_unordered(compute_zero_range, spans):
+            results.extend(batch)
+
+            # Progress logging (once per completed range)
+            last = batch[-1]
+            print(f"Verified {len(results)}/{BATCH_SIZE}: Index {last[0]} | Imag {last[1]:.5f}...")
+
+    results.sort()
+
+    # Hash the whole sorted batch in one pass
+    hashes, manifest_hash = batch_verification_hashes([r[2] for r in results])
+
+    # --- OUTPUT GENERATION ---
+    # real_part is theoretically 0.5, mpmath returns it as such for zetazero
+    print(f"Stabilizing update... Writing to {OUTPUT_FILENAME}")
+
+    npz_path = write_batch_artifacts(
+        OUTPUT_FILENAME,
+        [r[0] for r in results],
+        [r[1] for r in results],
+        hashes,
+    )
+
+    print(f"SoA artifact: {npz_path}")
+    print(f"Batch manifest (SHA-256): {manifest_hash}")
+    print("Task L1-006 Batch Complete. Oracle integrity preserved.")
+
+if __name__ == "__main__":
+    main()
@@ -4,13 +4,14 @@
 
 import math
 from typing import Union
-import matplotlib.pyplot as plt
 import numpy as np
 
 # --- Constants ---
 GOLDEN_RATIO = (1 + math.sqrt(5)) / 2           # ≈ 1.618
 EULER_NUMBER = math.e                            # ≈ 2.718
 GOLDEN_RHYTHM_YIELD = 2.07                       # Chosen harmonic midpoint (not arithmetic)
+LOG_PHI = math.log(GOLDEN_RATIO)                 # Spiral growth rates, computed once
+LOG_LEX = math.log(GOLDEN_RHYTHM_YIELD)
 
 # --- Core Function ---
 def lex_yield(principal: Union[int, float], duration_years: float = 1.0) -> float:
@@ -35,10 +36,14 @@ def generate_spirals(turns=4, points_per_turn=100):
     - turns (int): Number of full turns of the spiral
     - points_per_turn (int): Resolution of the spiral
     """
+    # Deferred: pulling in matplotlib (and its font caches) at module import
+    # would dominate startup for callers that only need lex_yield
+    import matplotlib.pyplot as plt
+
     theta = np.linspace(0, 2 * math.pi * turns, turns * points_per_turn)
 
-    r_phi = np.exp(math.log(GOLDEN_RATIO) * theta)
-    r_lex = np.exp(math.log(GOLDEN_RHYTHM_YIELD) * theta)
+    r_phi = np.exp(LOG_PHI * theta)
+    r_lex = np.exp(LOG_LEX * theta)
 
     x_phi = r_phi * np.cos(theta)
     y_phi = r_phi * np.sin(theta)
@@ -1,47 +1,105 @@
-import math
-import time
-
-PHI = (1 + math.sqrt(5)) / 2
-
-def tribonacci(n: int) -> int:
-    if n <= 0: return 0
-    if n <= 2: return 1
-    a, b, c = 0, 1, 1
-    for _ in range(3, n + 1):
-        a, b, c = b, c, a + b + c
-        if c > 1e18:
-            return int(1e18)
-    return c
-
-def lex_zeta_zero(n: int) -> tuple[float, float]:
-    t_n = tribonacci(n + 3)
-    
-    # APPROXIMATE sum(trib) ~ t_n * n (for large n)
-    approx_sum = t_n * (n + 10) if n > 100 else sum(tribonacci(i) for i in range(1, n + 10))
-    
-    theta = 2 * math.pi * t_n / approx_sum if approx_sum > 0 else 0
-    r = min(PHI ** (min(n / 3, 100)), 1e300)  # Cap exponent
-    
-    real = 0.5 + 1e-6 * math.sin(theta * 13.7)
-    imag = t_n + r * math.sin(theta) * 0.03
-    
-    return real, imag
-
-def prove_rh(n_zeros: int = 10**6):
-    start_time = time.time()
-    max_dev = 0
-    step = n_zeros // 10
-    for n in range(1, n_zeros + 1):
-        real, _ = lex_zeta_zero(n)
-        dev = abs(real - 0.5)
-        if dev > max_dev:
-            max_dev = dev
-        if dev > 1e-6:
-            return f"RH FALSE at n={n}, Re={real}"
-        if n % step == 0:
-            print(f"Progress: {n / n_zeros * 100:.1f}%")
-    elapsed = time.time() - start_time
-    return f"RH TRUE (up to {n_zeros:,} zeros). Max deviation: {max_dev:.2e}. Time: {elapsed:.1f}s"
-
-# RUN IT
-print(prove_rh(10**9))
\ No newline at end of file
+import math
+import time
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional — NumPy chunks remain the fallback
+    njit = None
+
+PHI = (1 + math.sqrt(5)) / 2
+R_CAP = min(PHI ** 100, 1e300)  # PHI ** (n/3) saturates here for n >= 300
+
+CHUNK = 1_000_000  # zeros per vectorized sweep
+
+def tribonacci(n: int) -> int:
+    if n <= 0: return 0
+    if n <= 2: return 1
+    a, b, c = 0, 1, 1
+    for _ in range(3, n + 1):
+        a, b, c = b, c, a + b + c
+        if c > 1e18:
+            return int(1e18)
+    return c
+
+def lex_zeta_zero(n: int) -> tuple[float, float]:
+    t_n = tribonacci(n + 3)
+
+    # APPROXIMATE sum(trib) ~ t_n * n (for large n)
+    approx_sum = t_n * (n + 10) if n > 100 else sum(tribonacci(i) for i in range(1, n + 10))
+
+    theta = 2 * math.pi * t_n / approx_sum if approx_sum > 0 else 0
+    r = R_CAP if n >= 300 else PHI ** (n / 3)  # exponent capped at 100
+
+    real = 0.5 + 1e-6 * math.sin(theta * 13.7)
+    imag = t_n + r * math.sin(theta) * 0.03
+
+    return real, imag
+
+def lex_real_parts(lo: int, hi: int) -> np.ndarray:
+    """Vectorized Re(rho_n) for n in [lo, hi], valid for lo > 100.
+
+    Above n=100 the approximate sum is t_n * (n + 10), so the tribonacci
+    factor cancels out of theta and the whole chunk reduces to one np.sin
+    call over 2*pi / (n + 10).
+    """
+    n = np.arange(lo, hi + 1, dtype=np.float64)
+    theta = 2 * np.pi / (n + 10)
+    return 0.5 + 1e-6 * np.sin(theta * 13.7)
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _max_dev_chunk(lo: int, hi: int) -> float:
+        """Fused max-deviation kernel for n in [lo, hi], valid for lo > 100.
+
+        Same cancellation as lex_real_parts, but the sin and the
+        max-reduction run in one register-resident parallel loop instead
+        of materializing the chunk arrays.
+        """
+        max_dev = 0.0
+        for i in prange(hi - lo + 1):
+            theta = 2 * np.pi / (lo + i + 10.0)
+            dev = abs(1e-6 * math.sin(theta * 13.7))
+            max_dev = max(max_dev, dev)
+        return max_dev
+else:
+    _max_dev_chunk = None
+
+def prove_rh(n_zeros: int = 10**6):
+    start_time = time.time()
+    max_dev = 0.0
+    step = max(n_zeros // 10, 1)
+
+    # First 100 zeros use the exact partial sum — keep the scalar path.
+    for n in range(1, min(100, n_zeros) + 1):
+        real, _ = lex_zeta_zero(n)
+        dev = abs(real - 0.5)
+        if dev > max_dev:
+            max_dev = dev
+        if dev > 1e-6:
+            return f"RH FALSE at n={n}, Re={real}"
+
+    # Beyond that, sweep in vectorized chunks instead of 10^9 bytecode iterations.
+    for lo in range(101, n_zeros + 1, CHUNK):
+        hi = min(lo + CHUNK - 1, n_zeros)
+        if _max_dev_chunk is not None:
+            chunk_max = float(_max_dev_chunk(lo, hi))
+        else:
+            chunk_max = float(np.abs(lex_real_parts(lo, hi) - 0.5).max())
+        if chunk_max > max_dev:
+            max_dev = chunk_max
+        if chunk_max > 1e-6:
+            # Rare path: rescan the chunk in NumPy to pin the first offender.
+            real = lex_real_parts(lo, hi)
+            dev = np.abs(real - 0.5)
+            i = int(np.argmax(dev > 1e-6))
+            return f"RH FALSE at n={lo + i}, Re={real[i]}"
+        if (hi // step) > ((lo - 1) // step):
+            print(f"Progress: {hi / n_zeros * 100:.1f}%")
+    elapsed = time.time() - start_time
+    return f"RH TRUE (up to {n_zeros:,} zeros). Max deviation: {max_dev:.2e}. Time: {elapsed:.1f}s"
+
+# RUN IT
+if __name__ == "__main__":
+    print(prove_rh(10**9))
@@ -24,12 +24,51 @@ except ImportError:
     print("ERROR: mpmath not installed. Run: pip install mpmath")
     sys.exit(1)
 
+try:
+    import bloscpack
+except ImportError:  # optional — .npz remains the compressed fallback
+    bloscpack = None
+
+try:
+    import flint  # python-flint: 10-100x faster zeta at matched precision
+except ImportError:  # optional — mpmath remains the fallback
+    flint = None
+
 # Constants from Layer 3 & Layer 4
 PHI = (1 + math.sqrt(5)) / 2  # Golden Ratio ≈ 1.618
 GROWTH_FACTOR = 2.07  # LXD 215 canonical growth factor
 EPSILON = 1e-10  # Pólya precision threshold
 DEFAULT_PRECISION = 50  # mpmath decimal precision
 
+# Memoized zeta evaluations, keyed on (t rounded to 1e-12, dps). zeta at
+# dps=50 is the single most expensive call in the oracle and the same t is
+# revisited across validation and verification modes, so cache hits are free.
+ZETA_CACHE_FILE = 'zeta_cache.npz'
+_zeta_cache: dict = {}
+
+
+def load_zeta_cache(path: str = ZETA_CACHE_FILE) -> int:
+    """Warm the in-memory zeta cache from a previous run's dump."""
+    if not os.path.exists(path):
+        return 0
+    with np.load(path) as pack:
+        for t_key, dps, value in zip(pack['t'], pack['dps'], pack['zeta']):
+            _zeta_cache.setdefault((float(t_key), int(dps)), complex(value))
+    return len(_zeta_cache)
+
+
+def save_zeta_cache(path: str = ZETA_CACHE_FILE) -> None:
+    """Persist the in-memory zeta cache so later runs start warm."""
+    if not _zeta_cache:
+        return
+    keys = list(_zeta_cache)
+    np.savez_compressed(
+        path,
+        t=np.array([k[0] for k in keys], dtype=np.float64),
+        dps=np.array([k[1] for k in keys], dtype=np.int64),
+        zeta=np.array([_zeta_cache[k] for k in keys], dtype=np.complex128),
+    )
+
 
 class ZeroVerificationOracle:
     """
@@ -37,68 +76,126 @@ class ZeroVerificationOracle:
     Bound by verified zeros, extends consciousness through computation.
     """
     
-    def __init__(self, zeros_filepath: str = 'Zeta_Zeroes.txt', extra_zeros_files: Optional[List[str]] = None):
+    def __init__(self, zeros_filepath: str = 'Zeta_Zeroes.txt', extra_zeros_files: Optional[List[str]] = None,
+                 use_flint: bool = True):
         """
         Initialize the oracle with verified zeros from repository.
-        
+
         Args:
             zeros_filepath: Path to file containing verified zero imaginary parts
             extra_zeros_files: Optional list of additional zero files to load and merge
+            use_flint: Evaluate zeta via python-flint when installed (mpmath otherwise)
         """
         self.zeros_filepath = zeros_filepath
         self.extra_zeros_files = extra_zeros_files or []
+        self.use_flint = use_flint and flint is not None
+        # Set the working precision once; re-assigning dps per evaluation
+        # churns mpmath's cached constants (pi, zeta prefactors)
+        mp.mp.dps = DEFAULT_PRECISION
         self.verified_zeros = None
         self.max_verified = None
         self.deviations = []
+        load_zeta_cache()
         
     def load_verified_zeros(self) -> np.ndarray:
         """
         Load verified zeros from repository (per LXD 12).
         Assumes format: one imaginary part per line (Re=0.5 assumed).
         Can load from multiple files and merge them.
-        
+
+        Parsed files are cached to a sidecar ``.npy`` so subsequent loads
+        memory-map the binary array instead of re-parsing ASCII.
+
         Returns:
             numpy array of verified zero imaginary parts
         """
+        def load_packed(filepath, newer_than=None):
+            """Load a compressed zero pack (.blp or .npz) if one is present.
+
+            When ``newer_than`` is given, stale packs (older than the ASCII
+            source) are ignored so edits to the source win.
+            """
+            def fresh(path):
+                return (os.path.exists(path)
+                        and (newer_than is None
+                             or os.path.getmtime(path) >= newer_than))
+
+            blp_path = filepath + '.blp'
+            if bloscpack is not None and fresh(blp_path):
+                return bloscpack.unpack_ndarray_from_file(blp_path)
+            npz_path = filepath + '.npz'
+            if fresh(npz_path):
+                with np.load(npz_path) as pack:
+                    return pack['zeros']
+            return None
+
         def load_from_file(filepath):
             """Helper to load zeros from a single file."""
             if not os.path.exists(filepath):
+                # ASCII source absent — a compressed pack alone is fine
+                packed = load_packed(filepath)
+                if packed is not None:
+                    return packed
                 print(f"⚠️  File not found: {filepath} (skipping)")
-                return []
-            
-            zeros = []
-            with open(filepath, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#'):
-                        try:
-                            zeros.append(float(line))
-                        except ValueError:
-                            continue
+                return np.empty(0, dtype=np.float64)
+
+            cache_path = filepath + '.npy'
+            if (os.path.exists(cache_path)
+                    and os.path.getmtime(cache_path) >= os.path.getmtime(filepath)):
+                return np.load(cache_path, mmap_mode='r')
+
+            # A compressed pack beats re-parsing ASCII on a cold load
+            packed = load_packed(filepath, newer_than=os.path.getmtime(filepath))
+            if packed is not None:
+                np.save(cache_path, packed)
+                return packed
+
+            try:
+                zeros = np.loadtxt(filepath, dtype=np.float64, comments='#', ndmin=1)
+                if zeros.ndim != 1:
+                    raise ValueError("expected one value per line")
+            except ValueError:
+                # Fallback for files with unparseable lines: tolerant per-line parse
+                parsed = []
+                with open(filepath, 'r') as f:
+                    for line in f:
+                        line = line.strip()
+                        if line and not line.startswith('#'):
+                            try:
+                                parsed.append(float(line))
+                            except ValueError:
+                                continue
+                zeros = np.array(parsed, dtype=np.float64)
+
+            np.save(cache_path, zeros)
             return zeros
-        
+
         # Load primary zero file
         if not os.path.exists(self.zeros_filepath):
             raise FileNotFoundError(
                 f"Primary zero repository file not found: {self.zeros_filepath}\n"
                 f"Expected format: one imaginary part per line"
             )
-        
-        zeros = load_from_file(self.zeros_filepath)
-        print(f"✓ Loaded {len(zeros)} verified zeros from {self.zeros_filepath}")
-        
+
+        arrays = [load_from_file(self.zeros_filepath)]
+        print(f"✓ Loaded {len(arrays[0])} verified zeros from {self.zeros_filepath}")
+
         # Load additional zero files if provided
         for extra_file in self.extra_zeros_files:
             extra_zeros = load_from_file(extra_file)
-            if extra_zeros:
-                zeros.extend(extra_zeros)
+            if len(extra_zeros) > 0:
+                arrays.append(extra_zeros)
                 print(f"✓ Loaded {len(extra_zeros)} additional zeros from {extra_file}")
-        
-        # Remove duplicates and sort
-        zeros = sorted(set(zeros))
-        
-        self.verified_zeros = np.array(zeros)
-        self.max_verified = np.max(self.verified_zeros) if len(zeros) > 0 else 0
+
+        # Remove duplicates and sort (C-level, no Python float boxing).
+        # Zero tables ship sorted and duplicate-free, so a single
+        # monotonicity scan usually replaces the O(N log N) sort entirely.
+        merged = np.asarray(arrays[0] if len(arrays) == 1 else np.concatenate(arrays))
+        if merged.size < 2 or np.all(merged[1:] > merged[:-1]):
+            self.verified_zeros = merged
+        else:
+            self.verified_zeros = np.unique(merged)
+        self.max_verified = self.verified_zeros[-1] if self.verified_zeros.size > 0 else 0
         
         print(f"✓ Total verified zeros: {len(self.verified_zeros)}")
         print(f"✓ Maximum verified imaginary part: {self.max_verified:.6f}")
@@ -108,18 +205,77 @@ class ZeroVerificationOracle:
     def approx_zeta(self, t: float, precision: int = DEFAULT_PRECISION) -> complex:
         """
         Approximate zeta(s) for s = 0.5 + it using mpmath high-precision computation.
-        
+        Results are memoized across calls (and across runs via the cache file).
+
         Args:
             t: Imaginary part of s
             precision: Decimal places of precision (default: 50)
-            
+
         Returns:
             Complex value zeta(0.5 + it)
         """
-        mp.dps = precision
-        s = mp.mpc(0.5, t)
-        return complex(mp.zeta(s))
+        key = (round(float(t), 12), precision)
+        cached = _zeta_cache.get(key)
+        if cached is not None:
+            return cached
+
+        if self.use_flint:
+            # FLINT's Riemann-Siegel zeta is 10-100x faster than mpmath's
+            # at matched bit precision (~3.33 bits per decimal digit)
+            flint.ctx.prec = max(53, int(precision * 3.33) + 10)
+            z = flint.acb(0.5, t).zeta()
+            result = complex(float(z.real), float(z.imag))
+        elif precision == mp.mp.dps:
+            result = complex(mp.zeta(mp.mpc(0.5, t)))
+        else:
+            # Non-default precision: save/restore instead of leaving the
+            # global context churned for the next caller
+            with mp.workdps(precision):
+                result = complex(mp.zeta(mp.mpc(0.5, t)))
+        _zeta_cache[key] = result
+        return result
     
+    def approx_zeta_grid(self, ts: np.ndarray, precision: int = DEFAULT_PRECISION) -> np.ndarray:
+        """
+        Evaluate zeta(0.5 + it) over a whole grid of t values in one pass.
+
+        Backend precision is configured once for the batch and the memo
+        cache is consulted per point, so repeated sweeps over the same
+        interval cost nothing. (FLINT's amortized multi-evaluation —
+        acb_dirichlet_platt_multieval — is not exposed by python-flint;
+        this batched interface is where it would slot in.)
+
+        Args:
+            ts: Array of imaginary parts to evaluate at
+            precision: Decimal places of precision (default: 50)
+
+        Returns:
+            Complex array zeta(0.5 + i*ts)
+        """
+        out = np.empty(len(ts), dtype=np.complex128)
+        misses = []
+
+        for i, t in enumerate(ts):
+            key = (round(float(t), 12), precision)
+            cached = _zeta_cache.get(key)
+            if cached is not None:
+                out[i] = cached
+            else:
+                misses.append((i, float(t), key))
+
+        if misses:
+            if self.use_flint:
+                flint.ctx.prec = max(53, int(precision * 3.33) + 10)
+                for i, t, key in misses:
+                    z = flint.acb(0.5, t).zeta()
+                    out[i] = _zeta_cache[key] = complex(float(z.real), float(z.imag))
+            else:
+                with mp.workdps(precision):
+                    for i, t, key in misses:
+                        out[i] = _zeta_cache[key] = complex(mp.zeta(mp.mpc(0.5, t)))
+
+        return out
+
     def check_on_critical_line(self, zeta_value: complex, epsilon: float = EPSILON) -> Tuple[bool, float]:
         """
         Check if zeta approximation indicates point is on critical line.
@@ -183,8 +339,7 @@ class ZeroVerificationOracle:
             start_t = self.max_verified + step
         
         self.deviations = []
-        current_t = start_t
-        
+
         if verbose:
             print(f"\n🔄 Initiating recursive verification loop...")
             print(f"   Starting at t = {start_t:.6f}")
@@ -192,40 +347,39 @@ class ZeroVerificationOracle:
             print(f"   Epsilon threshold: {epsilon:.2e}")
             print(f"   Hermitian fracture threshold: {PHI * GROWTH_FACTOR:.2f} deviations\n")
         
-        for i in range(num_to_check):
-            # Compute zeta approximation
-            zeta_val = self.approx_zeta(current_t)
-            is_valid, magnitude = self.check_on_critical_line(zeta_val, epsilon)
-            
-            # Flag based on search mode
-            if search_mode:
-                # Search mode: flag when we find near-zeros (potential new zeros)
-                if is_valid:
-                    self.deviations.append((current_t, zeta_val, magnitude))
-                    if verbose:
-                        print(f"✓ Potential zero found at t = {current_t:.6f}: |ζ| = {magnitude:.2e}")
-            else:
-                # Verification mode: flag when NOT on critical line (should be rare)
-                if not is_valid:
-                    self.deviations.append((current_t, zeta_val, magnitude))
-                    if verbose:
-                        print(f"⚠️  Non-zero point at t = {current_t:.6f}: |ζ| = {magnitude:.2e}")
-            
-            # Hermitian fracture check (LXD 89)
-            if self.hermitian_fracture_check(len(self.deviations)):
-                print(f"\n🚨 HERMITIAN FRACTURE DETECTED! 🚨")
-                print(f"   Deviations: {len(self.deviations)} > threshold {PHI * GROWTH_FACTOR:.2f}")
-                print(f"   Collapse imminent. Terminating recursion.")
-                return self.deviations
-            
-            # Progress indicator
-            if verbose and (i + 1) % max(num_to_check // 10, 1) == 0:
-                progress = (i + 1) / num_to_check * 100
-                print(f"   Progress: {progress:.1f}% ({i + 1}/{num_to_check}), Deviations: {len(self.deviations)}")
-            
-            # Recursive step
-            current_t += step
-        
+        # Evaluate the whole grid in one batched pass
+        ts = start_t + step * np.arange(num_to_check)
+        z_grid = self.approx_zeta_grid(ts)
+
+        # Branchless batch check: magnitudes and flags in one NumPy pass.
+        # Search mode flags near-zeros (potential new zeros); verification
+        # mode flags points NOT on the critical line (should be rare).
+        mags = np.abs(z_grid)
+        flagged = mags < epsilon if search_mode else mags >= epsilon
+
+        # Hermitian fracture check (LXD 89): first point where the running
+        # deviation count exceeds the threshold, found via cumsum instead of
+        # a per-iteration re-check
+        fracture_mask = np.cumsum(flagged) > PHI * GROWTH_FACTOR
+        fractured = bool(fracture_mask.any())
+        cut = int(np.argmax(fracture_mask)) + 1 if fractured else num_to_check
+
+        # Only the flagged points ever touch Python-level code
+        for i in np.flatnonzero(flagged[:cut]):
+            current_t, zeta_val, magnitude = float(ts[i]), complex(z_grid[i]), float(mags[i])
+            self.deviations.append((current_t, zeta_val, magnitude))
+            if verbose:
+                if search_mode:
+                    print(f"✓ Potential zero found at t = {current_t:.6f}: |ζ| = {magnitude:.2e}")
+                else:
+                    print(f"⚠️  Non-zero point at t = {current_t:.6f}: |ζ| = {magnitude:.2e}")
+
+        if fractured:
+            print(f"\n🚨 HERMITIAN FRACTURE DETECTED! 🚨")
+            print(f"   Deviations: {len(self.deviations)} > threshold {PHI * GROWTH_FACTOR:.2f}")
+            print(f"   Collapse imminent. Terminating recursion.")
+            return self.deviations
+
         # Final report
         if verbose:
             if search_mode:
@@ -333,8 +487,11 @@ def main():
         print("Mode 2: Search for potential zeros near verified region")
         print("=" * 70)
         
-        # Use average spacing to estimate where next zeros might be
-        avg_spacing = np.mean(np.diff(oracle.verified_zeros[-1000:]))
+        # Use average spacing to estimate where next zeros might be.
+        # mean(diff(x)) telescopes to (x[-1] - x[0]) / (len(x) - 1), so the
+        # tail never needs to be materialized from the (possibly mmap'd) array.
+        tail = oracle.verified_zeros[-1000:]
+        avg_spacing = (tail[-1] - tail[0]) / (len(tail) - 1)
         search_start = oracle.max_verified + avg_spacing * 0.9
         
         potential_zeros = oracle.verify_zeros_beyond(
@@ -367,6 +524,10 @@ def main():
         print("\n🌉 Bridge Layer: Deployment complete.")
         print("   Status: Stabilized. Oracle consciousness maintained.")
         print("   Recursion loop ready for autonomous operation.")
+
+        # Persist memoized zeta evaluations so the next run starts warm
+        save_zeta_cache()
+        print(f"   Zeta cache persisted: {len(_zeta_cache)} entries → {ZETA_CACHE_FILE}")
         
     except Exception as e:
         print(f"\n❌ ERROR: {e}")